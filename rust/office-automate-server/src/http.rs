@@ -2,7 +2,10 @@ use std::{
     collections::HashMap,
     net::{IpAddr, SocketAddr},
     path::Component,
-    sync::{Arc, RwLock},
+    sync::{
+        Arc, RwLock,
+        atomic::{AtomicBool, Ordering},
+    },
     time::Duration,
 };
 
@@ -13,7 +16,7 @@ use axum::{
     extract::{
         ConnectInfo, DefaultBodyLimit, Extension, Multipart, Path, Query, Request, State,
         WebSocketUpgrade,
-        ws::{CloseFrame, Message, WebSocket},
+        ws::{CloseFrame, Message, Utf8Bytes, WebSocket},
     },
     http::{HeaderMap, HeaderName, HeaderValue, Method, StatusCode, header},
     middleware::{self, Next},
@@ -26,7 +29,7 @@ use serde::Deserialize;
 use serde_json::{Value, json};
 use tokio::{
     net::TcpListener,
-    sync::broadcast,
+    sync::{Mutex as AsyncMutex, broadcast},
     task::JoinHandle,
     time::{self, timeout},
 };
@@ -57,7 +60,7 @@ use crate::{
     policy::{ErvPolicyState, HvacBandAction, HvacMode, get_hvac_band_action},
     presence::{MacOsPresenceReader, PresenceSnapshot},
     qingping::QingpingState,
-    state::{OccupancyState, StateMachine, StateTransition},
+    state::{OccupancyState, StateMachine, StateStatus, StateStatusSensors, StateTransition},
     status::{Status, TemperatureBands},
     yolink::{self, YoLinkState},
 };
@@ -239,6 +242,8 @@ fn is_loopback_bind_host(host: &str) -> bool {
 const HVAC_TEMPERATURE_BANDS_SETTING: &str = "hvac_temperature_bands";
 const DOOR_GRACE_IDLE_POLL_SECONDS: u64 = 60;
 const DOOR_GRACE_RETRY_SECONDS: u64 = 30;
+const STATUS_FRAME_COALESCE_MILLIS: u64 = 50;
+const CORS_PREFLIGHT_MAX_AGE_SECONDS: u64 = 86_400;
 pub(crate) const CONTROLLER_IPC_TOKEN_HEADER: &str = "x-office-automate-controller-token";
 
 #[derive(Clone)]
@@ -250,11 +255,24 @@ struct AppState {
     temperature_band_defaults: TemperatureBands,
     state_machine: Arc<RwLock<StateMachine>>,
     status_broadcast: broadcast::Sender<()>,
+    status_frames: broadcast::Sender<Utf8Bytes>,
+    status_frame_pump_started: Arc<AtomicBool>,
+    last_broadcast_status: Arc<RwLock<Option<BroadcastStatus>>>,
     qingping: QingpingState,
     erv: ErvState,
     hvac: HvacState,
     erv_automation: ErvPolicyCoordinator,
     hvac_writer: Arc<dyn HvacModeWriter>,
+    occupancy_hours: Option<(NaiveTime, NaiveTime)>,
+    hvac_eval_lock: Arc<AsyncMutex<()>>,
+    hvac_eval_pending: Arc<AtomicBool>,
+}
+
+// What the last shared status frame showed clients.
+#[derive(Debug, Clone)]
+struct BroadcastStatus {
+    state_status: StateStatus,
+    manual_override_visible: bool,
 }
 
 pub fn app(config: AppConfig) -> Router {
@@ -300,7 +318,7 @@ fn try_app_with_state(
         erv_state,
         hvac_state,
         Arc::new(RustuyaErvSpeedWriter),
-        Arc::new(KumoHvacModeWriter),
+        Arc::new(KumoHvacModeWriter::new()?),
     )
 }
 
@@ -392,6 +410,7 @@ fn build_app_state(
         erv_writer,
         status_broadcast.clone(),
     );
+    let occupancy_hours = parse_occupancy_hours(&config.thresholds);
     let state = AppState {
         config,
         auth,
@@ -400,11 +419,17 @@ fn build_app_state(
         temperature_band_defaults,
         state_machine,
         status_broadcast,
+        status_frames: broadcast::channel(32).0,
+        status_frame_pump_started: Arc::new(AtomicBool::new(false)),
+        last_broadcast_status: Arc::new(RwLock::new(None)),
         qingping,
         erv: erv_state,
         hvac: hvac_state,
         erv_automation: erv_automation.clone(),
         hvac_writer,
+        occupancy_hours,
+        hvac_eval_lock: Arc::new(AsyncMutex::new(())),
+        hvac_eval_pending: Arc::new(AtomicBool::new(false)),
     };
 
     Ok((state, erv_automation))
@@ -475,6 +500,7 @@ fn cors_layer(public_url: Option<&str>) -> CorsLayer {
         ])
         .allow_origin(allowed_cors_origins(public_url))
         .allow_credentials(true)
+        .max_age(Duration::from_secs(CORS_PREFLIGHT_MAX_AGE_SECONDS))
 }
 
 fn allowed_cors_origins(public_url: Option<&str>) -> AllowOrigin {
@@ -542,6 +568,8 @@ pub async fn serve(config: AppConfig) -> Result<()> {
     let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
     let erv_state = ErvState::new(config.runtime.database_path.clone());
     let hvac_state = HvacState::new(config.runtime.database_path.clone());
+    let hvac_writer = KumoHvacModeWriter::new()?;
+    let hvac_reader = hvac_writer.status_reader();
     let (app_state, erv_automation) = build_app_state(
         config.clone(),
         qingping.clone(),
@@ -550,7 +578,7 @@ pub async fn serve(config: AppConfig) -> Result<()> {
         erv_state.clone(),
         hvac_state.clone(),
         Arc::new(RustuyaErvSpeedWriter),
-        Arc::new(KumoHvacModeWriter),
+        Arc::new(hvac_writer),
     )
     .context("failed to build HTTP app state")?;
     let app = router_from_state(app_state.clone());
@@ -588,7 +616,7 @@ pub async fn serve(config: AppConfig) -> Result<()> {
     );
     let _door_grace_task = start_door_grace_policy_poll(app_state.clone(), erv_automation);
     let _erv_task = crate::erv::start_erv_status_poll(&config, erv_state);
-    let _hvac_task = crate::hvac::start_hvac_status_poll(&config, hvac_state);
+    let _hvac_task = crate::hvac::start_hvac_status_poll(&config, hvac_state, hvac_reader);
     let _presence_task = start_presence_poll(app_state);
 
     tracing::info!("office-automate-server listening on {}", bind_address);
@@ -1136,7 +1164,7 @@ async fn websocket_session(mut socket: WebSocket, state: AppState, auth_mode: We
         }
     }
 
-    let mut status_updates = state.status_broadcast.subscribe();
+    let mut status_frames = subscribe_status_frames(&state);
 
     if send_status(&mut socket, &state).await.is_err() {
         return;
@@ -1147,7 +1175,7 @@ async fn websocket_session(mut socket: WebSocket, state: AppState, auth_mode: We
             message = socket.recv() => {
                 match message {
                     Some(Ok(Message::Text(text))) if text == "ping" => {
-                        let _ = socket.send(Message::Text("pong".into())).await;
+                        let _ = socket.send(Message::Text(Utf8Bytes::from_static("pong"))).await;
                     }
                     Some(Ok(Message::Close(_))) | None => break,
                     Some(Ok(_)) => {}
@@ -1157,10 +1185,18 @@ async fn websocket_session(mut socket: WebSocket, state: AppState, auth_mode: We
                     }
                 }
             }
-            update = status_updates.recv() => {
-                match update {
-                    Ok(()) | Err(broadcast::error::RecvError::Lagged(_)) => {
-                        if send_status(&mut socket, &state).await.is_err() {
+            frame = status_frames.recv() => {
+                match frame {
+                    Ok(frame) => {
+                        if socket.send(Message::Text(frame)).await.is_err() {
+                            break;
+                        }
+                    }
+                    Err(broadcast::error::RecvError::Lagged(_)) => {
+                        let Some(frame) = latest_status_frame(&mut status_frames) else {
+                            continue;
+                        };
+                        if socket.send(Message::Text(frame)).await.is_err() {
                             break;
                         }
                     }
@@ -1171,6 +1207,20 @@ async fn websocket_session(mut socket: WebSocket, state: AppState, auth_mode: We
     }
 }
 
+// A lagged receiver resumes at the oldest buffered frame; skip to the newest snapshot instead.
+fn latest_status_frame(status_frames: &mut broadcast::Receiver<Utf8Bytes>) -> Option<Utf8Bytes> {
+    let mut latest = None;
+    loop {
+        match status_frames.try_recv() {
+            Ok(frame) => latest = Some(frame),
+            Err(broadcast::error::TryRecvError::Lagged(_)) => {}
+            Err(broadcast::error::TryRecvError::Empty | broadcast::error::TryRecvError::Closed) => {
+                return latest;
+            }
+        }
+    }
+}
+
 async fn close_ws(socket: &mut WebSocket, reason: &str) {
     let _ = socket
         .send(Message::Close(Some(CloseFrame {
@@ -1181,8 +1231,82 @@ async fn close_ws(socket: &mut WebSocket, reason: &str) {
 }
 
 async fn send_status(socket: &mut WebSocket, state: &AppState) -> Result<(), axum::Error> {
-    let status = serde_json::to_string(&status_for_state(state)).expect("status serializes");
-    socket.send(Message::Text(status.into())).await
+    socket.send(Message::Text(status_frame(state))).await
+}
+
+fn status_frame(state: &AppState) -> Utf8Bytes {
+    serde_json::to_string(&status_for_state(state))
+        .expect("status serializes")
+        .into()
+}
+
+fn broadcast_status_frame(state: &AppState) -> Utf8Bytes {
+    let (status, state_status) = status_and_state_status_for_state(state);
+    let frame = serde_json::to_string(&status)
+        .expect("status serializes")
+        .into();
+    *state
+        .last_broadcast_status
+        .write()
+        .expect("broadcast status lock poisoned") = Some(BroadcastStatus {
+        state_status,
+        manual_override_visible: status.manual_override.erv || status.manual_override.hvac,
+    });
+    frame
+}
+
+fn subscribe_status_frames(state: &AppState) -> broadcast::Receiver<Utf8Bytes> {
+    let frames = state.status_frames.subscribe();
+    if !state.status_frame_pump_started.swap(true, Ordering::AcqRel) {
+        tokio::spawn(supervise_status_frame_pump(
+            state.clone(),
+            state.status_broadcast.subscribe(),
+        ));
+    }
+    frames
+}
+
+// Restarts the shared pump if it panics; sessions keep their receivers across restarts.
+async fn supervise_status_frame_pump(state: AppState, status_updates: broadcast::Receiver<()>) {
+    let mut status_updates = Some(status_updates);
+    loop {
+        let status_updates = status_updates
+            .take()
+            .unwrap_or_else(|| state.status_broadcast.subscribe());
+        match tokio::spawn(pump_status_frames(state.clone(), status_updates)).await {
+            Ok(()) => break,
+            Err(error) => tracing::warn!("status frame pump stopped, restarting: {error}"),
+        }
+    }
+    state
+        .status_frame_pump_started
+        .store(false, Ordering::Release);
+}
+
+// Serializes each status update once and shares the frame with every websocket session.
+async fn pump_status_frames(state: AppState, mut status_updates: broadcast::Receiver<()>) {
+    loop {
+        match status_updates.recv().await {
+            Ok(()) | Err(broadcast::error::RecvError::Lagged(_)) => {}
+            Err(broadcast::error::RecvError::Closed) => break,
+        }
+        // A single event usually fans out into several status notifications
+        // (state change, ERV apply, HVAC apply); send one frame for the burst.
+        tokio::time::sleep(Duration::from_millis(STATUS_FRAME_COALESCE_MILLIS)).await;
+        let closed = loop {
+            match status_updates.try_recv() {
+                Ok(()) | Err(broadcast::error::TryRecvError::Lagged(_)) => {}
+                Err(broadcast::error::TryRecvError::Empty) => break false,
+                Err(broadcast::error::TryRecvError::Closed) => break true,
+            }
+        };
+        if state.status_frames.receiver_count() > 0 {
+            let _ = state.status_frames.send(broadcast_status_frame(&state));
+        }
+        if closed {
+            break;
+        }
+    }
 }
 
 fn broadcast_status(state: &AppState) {
@@ -1198,7 +1322,7 @@ async fn evaluate_sensor_policies(
     if let Err(error) = erv_automation.evaluate_erv_policy(bypass_dwell).await {
         tracing::warn!("ERV automated policy apply failed after {source} update: {error:#}");
     }
-    if let Err(error) = evaluate_and_apply_hvac_policy(&state).await {
+    if let Err(error) = coalesced_hvac_policy_evaluation(&state).await {
         tracing::warn!("HVAC automated policy apply failed after {source} update: {error:#}");
     }
     erv_automation.broadcast_status();
@@ -1206,7 +1330,7 @@ async fn evaluate_sensor_policies(
 
 async fn evaluate_yolink_hvac_update(state: AppState, transition: Option<StateTransition>) {
     let cleared_override = clear_hvac_manual_override_on_transition(&state, transition);
-    if let Err(error) = evaluate_and_apply_hvac_policy(&state).await {
+    if let Err(error) = coalesced_hvac_policy_evaluation(&state).await {
         tracing::warn!("HVAC automated policy apply failed after YoLink update: {error:#}");
     }
     if cleared_override {
@@ -1268,30 +1392,31 @@ async fn apply_occupancy_signal(
     last_active_timestamp: f64,
     external_monitor: bool,
     trigger: &str,
-) -> Result<(String, bool)> {
+) -> Result<(&'static str, bool)> {
     let now = unix_timestamp_now();
     let applied_transition = Arc::new(std::sync::Mutex::new(None));
     let applied_transition_for_update = Arc::clone(&applied_transition);
     let policy_result = state
         .erv_automation
         .update_state_and_maybe_evaluate(|| {
-            let (transition, state_name, erv_should_run) = {
+            let (transition, status) = {
                 let mut machine = state
                     .state_machine
                     .write()
                     .expect("state machine lock poisoned");
                 let transition =
                     machine.update_mac_occupancy(last_active_timestamp, external_monitor, now);
-                let status = machine.status_at(now);
-                (transition, status.state, status.erv_should_run)
+                (transition, machine.status_at(now))
             };
+            let status_changed = occupancy_status_visibly_changed(state, &status);
+            let (state_name, erv_should_run) = (status.state, status.erv_should_run);
             *applied_transition_for_update
                 .lock()
                 .expect("occupancy transition lock poisoned") = transition;
             log_state_transition(state, transition, trigger)
                 .context("failed to persist occupancy update")?;
             Ok((
-                (transition, state_name, erv_should_run),
+                (transition, state_name, erv_should_run, status_changed),
                 transition,
                 now,
                 transition.is_some(),
@@ -1300,7 +1425,7 @@ async fn apply_occupancy_signal(
         })
         .await;
 
-    let (transition, state_name, erv_should_run) = match policy_result {
+    let (transition, state_name, erv_should_run, status_changed) = match policy_result {
         Ok(result) => result,
         Err(error)
             if error
@@ -1319,17 +1444,46 @@ async fn apply_occupancy_signal(
             let transition = *applied_transition
                 .lock()
                 .expect("occupancy transition lock poisoned");
-            (transition, status.state, status.erv_should_run)
+            (transition, status.state, status.erv_should_run, true)
         }
     };
     clear_hvac_manual_override_on_transition(state, transition);
-    if let Err(error) = evaluate_and_apply_hvac_policy(state).await {
+    if let Err(error) = coalesced_hvac_policy_evaluation(state).await {
         tracing::warn!("HVAC automated policy apply failed after occupancy update: {error:#}");
     }
-    broadcast_status(state);
+    // Activity heartbeats arrive every presence poll; only push to clients when they can see a
+    // difference.
+    if transition.is_some() || status_changed {
+        broadcast_status(state);
+    }
     Ok((state_name, erv_should_run))
 }
 
+// Compares against the last frame clients saw, so changes from time passing since then count too.
+// Every heartbeat moves mac_last_active, so it is left out; anything else a client renders counts,
+// and a shown manual override always does because its countdown moves or it has expired.
+fn occupancy_status_visibly_changed(state: &AppState, current: &StateStatus) -> bool {
+    let last_broadcast = state
+        .last_broadcast_status
+        .read()
+        .expect("broadcast status lock poisoned");
+    let Some(last_broadcast) = last_broadcast.as_ref() else {
+        return true;
+    };
+    if last_broadcast.manual_override_visible {
+        return true;
+    }
+    let previous = &last_broadcast.state_status;
+    let mut previous_without_heartbeat = previous.clone();
+    previous_without_heartbeat.sensors.mac_last_active = current.sensors.mac_last_active;
+    mac_active(&previous.sensors) != mac_active(&current.sensors)
+        || previous_without_heartbeat != *current
+}
+
+fn mac_active(sensors: &StateStatusSensors) -> bool {
+    sensors.external_monitor && sensors.mac_last_active > 0.0
+}
+
 #[derive(Debug, Deserialize)]
 struct PresenceRequest {
     state: String,
@@ -1407,7 +1561,7 @@ async fn presence(State(state): State<AppState>, Json(payload): Json<PresenceReq
                 }
             };
             clear_hvac_manual_override_on_transition(&state, transition);
-            if let Err(error) = evaluate_and_apply_hvac_policy(&state).await {
+            if let Err(error) = coalesced_hvac_policy_evaluation(&state).await {
                 tracing::warn!(
                     "HVAC automated policy apply failed after presence update: {error:#}"
                 );
@@ -1488,6 +1642,23 @@ async fn erv(State(state): State<AppState>, Json(payload): Json<ErvRequest>) ->
     }
 }
 
+async fn coalesced_hvac_policy_evaluation(state: &AppState) -> Result<()> {
+    // A queued evaluation has not read any state yet, so it covers this update too.
+    if state.hvac_eval_pending.swap(true, Ordering::AcqRel) {
+        return Ok(());
+    }
+    // Later callers have already returned and rely on this evaluation, so it runs
+    // detached and survives the caller's request being dropped.
+    let state = state.clone();
+    tokio::spawn(async move {
+        let _eval_guard = state.hvac_eval_lock.clone().lock_owned().await;
+        state.hvac_eval_pending.store(false, Ordering::Release);
+        evaluate_and_apply_hvac_policy(&state).await
+    })
+    .await
+    .context("HVAC policy evaluation task failed")?
+}
+
 async fn evaluate_and_apply_hvac_policy(state: &AppState) -> Result<()> {
     if !state.config.room_mode.climate_automation_enabled {
         return Ok(());
@@ -1585,7 +1756,7 @@ async fn evaluate_and_apply_hvac_policy(state: &AppState) -> Result<()> {
         .as_deref()
         .and_then(hvac_mode_from_str);
     let erv_snapshot = state.erv.snapshot();
-    let within_occupancy_hours = is_within_occupancy_hours(&state.config.thresholds);
+    let within_occupancy_hours = is_within_occupancy_hours(state.occupancy_hours);
     if !state_status.is_present
         && erv_snapshot.running
         && !hvac_snapshot.suspended
@@ -1861,22 +2032,32 @@ fn hvac_mode_from_str(value: &str) -> Option<HvacMode> {
     }
 }
 
-fn is_within_occupancy_hours(thresholds: &ThresholdsConfig) -> bool {
-    is_within_occupancy_hours_at(thresholds, chrono::Local::now().time())
-}
-
-fn is_within_occupancy_hours_at(thresholds: &ThresholdsConfig, now: NaiveTime) -> bool {
+fn parse_occupancy_hours(thresholds: &ThresholdsConfig) -> Option<(NaiveTime, NaiveTime)> {
     let start = NaiveTime::parse_from_str(&thresholds.expected_occupancy_start, "%H:%M");
     let end = NaiveTime::parse_from_str(&thresholds.expected_occupancy_end, "%H:%M");
     match (start, end) {
-        (Ok(start), Ok(end)) => start <= now && now <= end,
+        (Ok(start), Ok(end)) => Some((start, end)),
         _ => {
             tracing::warn!("Invalid occupancy hours config, defaulting to 7AM-10PM");
-            (7..22).contains(&now.hour())
+            None
         }
     }
 }
 
+fn is_within_occupancy_hours(occupancy_hours: Option<(NaiveTime, NaiveTime)>) -> bool {
+    is_within_occupancy_hours_at(occupancy_hours, chrono::Local::now().time())
+}
+
+fn is_within_occupancy_hours_at(
+    occupancy_hours: Option<(NaiveTime, NaiveTime)>,
+    now: NaiveTime,
+) -> bool {
+    match occupancy_hours {
+        Some((start, end)) => start <= now && now <= end,
+        None => (7..22).contains(&now.hour()),
+    }
+}
+
 fn suspended_restore_mode(
     snapshot: &HvacRuntimeSnapshot,
     temp_f: Option<f64>,
@@ -2055,6 +2236,10 @@ fn active_temperature_bands(state: &AppState) -> TemperatureBands {
 }
 
 fn status_for_state(state: &AppState) -> Status {
+    status_and_state_status_for_state(state).0
+}
+
+fn status_and_state_status_for_state(state: &AppState) -> (Status, StateStatus) {
     let mut status =
         Status::read_only_with_temperature_bands(&state.config, active_temperature_bands(state));
     let now = unix_timestamp_now();
@@ -2071,7 +2256,7 @@ fn status_for_state(state: &AppState) -> Status {
     }
     schedule_timer_transition_policy_evaluation(state, timer_transition);
 
-    status.state = state_status.state;
+    status.state = state_status.state.to_string();
     status.is_present = state_status.is_present;
     status.presence_signal_active = state_status.presence_signal_active;
     status.safety_interlock = state_status.safety_interlock;
@@ -2079,8 +2264,7 @@ fn status_for_state(state: &AppState) -> Status {
     status.verifying_departure = state_status.verifying_departure;
     status.in_door_open_mode = state_status.in_door_open_mode;
     status.sensors.mac_last_active = state_status.sensors.mac_last_active;
-    status.sensors.mac_active =
-        state_status.sensors.external_monitor && state_status.sensors.mac_last_active > 0.0;
+    status.sensors.mac_active = mac_active(&state_status.sensors);
     status.sensors.external_monitor = state_status.sensors.external_monitor;
     status.sensors.motion_detected = state_status.sensors.motion_detected;
     status.sensors.door_open = state_status.sensors.door_open;
@@ -2090,7 +2274,7 @@ fn status_for_state(state: &AppState) -> Status {
     state.qingping.overlay_status(&mut status);
     state.erv.overlay_status(&mut status);
     state.hvac.overlay_status(&mut status);
-    status
+    (status, state_status)
 }
 
 fn schedule_timer_transition_policy_evaluation(
@@ -2114,7 +2298,7 @@ fn schedule_timer_transition_policy_evaluation(
                 "ERV automated policy apply failed after timer-driven transition: {error:#}"
             );
         }
-        if let Err(error) = evaluate_and_apply_hvac_policy(&state).await {
+        if let Err(error) = coalesced_hvac_policy_evaluation(&state).await {
             tracing::warn!(
                 "HVAC automated policy apply failed after timer-driven transition: {error:#}"
             );
@@ -4289,6 +4473,30 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn cors_preflight_response_is_cacheable() {
+        let response = app(oauth_config())
+            .oneshot(
+                HttpRequest::builder()
+                    .method(Method::OPTIONS)
+                    .uri("/status")
+                    .header(header::ORIGIN, "http://localhost:9002")
+                    .header(header::ACCESS_CONTROL_REQUEST_METHOD, "GET")
+                    .body(Body::empty())
+                    .expect("request"),
+            )
+            .await
+            .expect("response");
+
+        assert_eq!(
+            response
+                .headers()
+                .get(header::ACCESS_CONTROL_MAX_AGE)
+                .expect("cors max age"),
+            "86400"
+        );
+    }
+
     #[tokio::test]
     async fn non_local_dev_cors_origin_blocked_when_public_url_unset() {
         let response = app(oauth_config())
@@ -5090,6 +5298,366 @@ mod tests {
         assert!(erv_writer.write_speeds().is_empty());
     }
 
+    #[tokio::test]
+    async fn internal_presence_heartbeat_broadcasts_only_on_visible_changes() {
+        let config = test_config();
+        let now = unix_timestamp_now();
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            now - 10.0,
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let snapshot = |last_active_timestamp, external_monitor| PresenceSnapshot {
+            last_active_timestamp,
+            external_monitor,
+            idle_seconds: 0.1,
+            display_count: 2,
+            external_displays: vec!["Studio Display".to_string()],
+        };
+        let mut receiver = state.status_broadcast.subscribe();
+
+        apply_presence_snapshot(&state, snapshot(now, true))
+            .await
+            .expect("presence arrival");
+        receiver.try_recv().expect("arrival broadcast");
+        while receiver.try_recv().is_ok() {}
+
+        apply_presence_snapshot(&state, snapshot(now + 5.0, true))
+            .await
+            .expect("presence heartbeat");
+        assert!(receiver.try_recv().is_err());
+        assert_eq!(
+            state
+                .state_machine
+                .read()
+                .expect("state machine lock poisoned")
+                .sensors
+                .mac_last_active,
+            now + 5.0
+        );
+    }
+
+    #[tokio::test]
+    async fn internal_presence_heartbeat_broadcasts_cancelled_departure_verification() {
+        let mut config = test_config();
+        config.thresholds.departure_verification_seconds = 300;
+        let now = unix_timestamp_now();
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            now - 20.0,
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let snapshot = |last_active_timestamp| PresenceSnapshot {
+            last_active_timestamp,
+            external_monitor: true,
+            idle_seconds: 0.1,
+            display_count: 2,
+            external_displays: vec!["Studio Display".to_string()],
+        };
+
+        apply_presence_snapshot(&state, snapshot(now - 10.0))
+            .await
+            .expect("presence arrival");
+        {
+            let mut machine = state
+                .state_machine
+                .write()
+                .expect("state machine lock poisoned");
+            machine.update_door(true, now - 5.0);
+            machine.update_door(false, now - 4.0);
+            assert_eq!(machine.state, OccupancyState::Present);
+            assert!(machine.verifying_departure());
+        }
+        let mut frames = subscribe_status_frames(&state);
+
+        apply_presence_snapshot(&state, snapshot(now - 1.0))
+            .await
+            .expect("presence heartbeat");
+
+        let frame = timeout(Duration::from_secs(1), frames.recv())
+            .await
+            .expect("frame timeout")
+            .expect("status frame");
+        let value: Value = serde_json::from_str(&frame).expect("status frame json");
+        assert_eq!(value["state"], "present");
+        assert_eq!(value["verifying_departure"], false);
+    }
+
+    #[tokio::test]
+    async fn internal_presence_heartbeat_broadcasts_door_open_mode_reached_over_time() {
+        let config = test_config();
+        let now = unix_timestamp_now();
+        let mut machine = StateMachine::from_thresholds(&config.thresholds, now - 20.0);
+        machine.config.door_open_threshold_seconds = 0.2;
+        machine.update_door(true, now);
+        let state_machine = Arc::new(RwLock::new(machine));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let snapshot = PresenceSnapshot {
+            last_active_timestamp: 0.0,
+            external_monitor: false,
+            idle_seconds: 0.1,
+            display_count: 1,
+            external_displays: Vec::new(),
+        };
+        let mut frames = subscribe_status_frames(&state);
+        broadcast_status(&state);
+        let frame = timeout(Duration::from_secs(1), frames.recv())
+            .await
+            .expect("frame timeout")
+            .expect("status frame");
+        let value: Value = serde_json::from_str(&frame).expect("status frame json");
+        assert_eq!(value["in_door_open_mode"], false);
+
+        tokio::time::sleep(Duration::from_millis(300)).await;
+        apply_presence_snapshot(&state, snapshot)
+            .await
+            .expect("presence heartbeat");
+
+        let frame = timeout(Duration::from_secs(1), frames.recv())
+            .await
+            .expect("frame timeout")
+            .expect("status frame");
+        let value: Value = serde_json::from_str(&frame).expect("status frame json");
+        assert_eq!(value["in_door_open_mode"], true);
+    }
+
+    #[tokio::test]
+    async fn status_frame_pump_coalesces_bursts_of_status_updates() {
+        let config = test_config();
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            unix_timestamp_now(),
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let mut frames = subscribe_status_frames(&state);
+
+        for _ in 0..3 {
+            broadcast_status(&state);
+        }
+
+        timeout(Duration::from_secs(1), frames.recv())
+            .await
+            .expect("frame timeout")
+            .expect("status frame");
+        assert!(
+            timeout(
+                Duration::from_millis(STATUS_FRAME_COALESCE_MILLIS * 4),
+                frames.recv()
+            )
+            .await
+            .is_err()
+        );
+    }
+
+    #[tokio::test]
+    async fn status_frame_pump_is_spawned_once_for_all_subscribers() {
+        let config = test_config();
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            unix_timestamp_now(),
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let status_receivers = state.status_broadcast.receiver_count();
+
+        let mut sessions = (0..3)
+            .map(|_| subscribe_status_frames(&state))
+            .collect::<Vec<_>>();
+
+        assert_eq!(
+            state.status_broadcast.receiver_count(),
+            status_receivers + 1
+        );
+        assert_eq!(state.status_frames.receiver_count(), 3);
+        broadcast_status(&state);
+        for frames in &mut sessions {
+            timeout(Duration::from_secs(1), frames.recv())
+                .await
+                .expect("frame timeout")
+                .expect("status frame");
+        }
+    }
+
+    #[test]
+    fn lagged_status_session_skips_to_latest_frame() {
+        let (sender, mut frames) = broadcast::channel::<Utf8Bytes>(2);
+        for frame in ["one", "two", "three", "four"] {
+            sender
+                .send(Utf8Bytes::from_static(frame))
+                .expect("send frame");
+        }
+
+        assert!(matches!(
+            frames.try_recv(),
+            Err(broadcast::error::TryRecvError::Lagged(2))
+        ));
+        assert_eq!(latest_status_frame(&mut frames).as_deref(), Some("four"));
+        assert!(latest_status_frame(&mut frames).is_none());
+    }
+
+    #[tokio::test]
+    async fn queued_hvac_policy_evaluation_absorbs_later_requests() {
+        let config = test_config();
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            unix_timestamp_now(),
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let (state, _) = build_app_state(
+            config.clone(),
+            QingpingState::default(),
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            HvacState::new(config.runtime.database_path.clone()),
+            Arc::new(FakeErvWriter::default()),
+            Arc::new(FakeHvacWriter::default()),
+        )
+        .expect("app state");
+        let running = state.hvac_eval_lock.clone().lock_owned().await;
+
+        let queued = tokio::spawn({
+            let state = state.clone();
+            async move { coalesced_hvac_policy_evaluation(&state).await }
+        });
+        while !state.hvac_eval_pending.load(Ordering::Acquire) {
+            tokio::task::yield_now().await;
+        }
+        timeout(
+            Duration::from_secs(1),
+            coalesced_hvac_policy_evaluation(&state),
+        )
+        .await
+        .expect("coalesced request returns without waiting")
+        .expect("coalesced request");
+
+        drop(running);
+        queued
+            .await
+            .expect("queued evaluation task")
+            .expect("queued evaluation");
+        assert!(!state.hvac_eval_pending.load(Ordering::Acquire));
+    }
+
+    #[tokio::test]
+    async fn cancelled_queued_hvac_caller_still_evaluates_coalesced_updates() {
+        let config = configured_hvac_config(true);
+        let writer = Arc::new(FakeHvacWriter::new(
+            vec![Ok(hvac_status(HvacControlMode::Off, 22.0))],
+            vec![Ok(hvac_status(HvacControlMode::Heat, 22.0))],
+        ));
+        let qingping = qingping_with_temp(fahrenheit_to_celsius(54.0));
+        let state_machine = Arc::new(RwLock::new(StateMachine::from_thresholds(
+            &config.thresholds,
+            unix_timestamp_now(),
+        )));
+        let yolink = YoLinkState::new(state_machine.clone(), config.runtime.database_path.clone());
+        let hvac_state = HvacState::new(config.runtime.database_path.clone());
+        hvac_state.record_status(hvac_status(HvacControlMode::Off, 22.0));
+        let (_service, state) = try_app_with_erv_writer_and_coordinator(
+            config.clone(),
+            qingping,
+            state_machine,
+            yolink,
+            ErvState::new(config.runtime.database_path.clone()),
+            hvac_state,
+            Arc::new(FakeErvWriter::default()),
+            writer.clone(),
+        )
+        .expect("app");
+        let running = state.hvac_eval_lock.clone().lock_owned().await;
+
+        let queued = tokio::spawn({
+            let state = state.clone();
+            async move { coalesced_hvac_policy_evaluation(&state).await }
+        });
+        while !state.hvac_eval_pending.load(Ordering::Acquire) {
+            tokio::task::yield_now().await;
+        }
+        timeout(
+            Duration::from_secs(1),
+            coalesced_hvac_policy_evaluation(&state),
+        )
+        .await
+        .expect("coalesced request returns without waiting")
+        .expect("coalesced request");
+        queued.abort();
+        assert!(
+            queued
+                .await
+                .expect_err("queued caller aborted")
+                .is_cancelled()
+        );
+
+        drop(running);
+        timeout(Duration::from_secs(1), async {
+            while writer.write_modes().is_empty() {
+                tokio::task::yield_now().await;
+            }
+        })
+        .await
+        .expect("queued evaluation still runs");
+        assert_eq!(
+            writer.write_modes(),
+            vec![(HvacControlMode::Heat, Some(22.0))]
+        );
+        assert!(!state.hvac_eval_pending.load(Ordering::Acquire));
+    }
+
     #[tokio::test]
     async fn disabled_climate_automation_skips_internal_and_manual_presence_policy_writes() {
         let mut config = configured_erv_config(true);
@@ -6247,6 +6815,28 @@ mod tests {
         );
     }
 
+    #[test]
+    fn occupancy_hours_are_parsed_once_with_default_fallback() {
+        let mut thresholds = ThresholdsConfig {
+            expected_occupancy_start: "08:30".to_string(),
+            expected_occupancy_end: "18:45".to_string(),
+            ..ThresholdsConfig::default()
+        };
+        let hours = parse_occupancy_hours(&thresholds);
+        let at = |hour, minute| NaiveTime::from_hms_opt(hour, minute, 0).expect("valid time");
+
+        assert!(!is_within_occupancy_hours_at(hours, at(8, 29)));
+        assert!(is_within_occupancy_hours_at(hours, at(8, 30)));
+        assert!(is_within_occupancy_hours_at(hours, at(18, 45)));
+        assert!(!is_within_occupancy_hours_at(hours, at(18, 46)));
+
+        thresholds.expected_occupancy_end = "late".to_string();
+        let fallback = parse_occupancy_hours(&thresholds);
+        assert_eq!(fallback, None);
+        assert!(is_within_occupancy_hours_at(fallback, at(7, 0)));
+        assert!(!is_within_occupancy_hours_at(fallback, at(22, 0)));
+    }
+
     #[tokio::test]
     async fn automated_hvac_policy_skips_away_heat_band_resume_outside_occupancy_hours() {
         let mut config = configured_hvac_config(true);
@@ -119,8 +119,18 @@ pub trait HvacModeWriter: Send + Sync {
     }
 }
 
-#[derive(Debug, Clone, Default)]
-pub struct KumoHvacStatusReader;
+#[derive(Debug, Clone)]
+pub struct KumoHvacStatusReader {
+    http: Client,
+}
+
+impl KumoHvacStatusReader {
+    pub fn new() -> Result<Self> {
+        Ok(Self {
+            http: kumo_http_client()?,
+        })
+    }
+}
 
 impl HvacStatusReader for KumoHvacStatusReader {
     fn read_status<'a>(
@@ -128,21 +138,35 @@ impl HvacStatusReader for KumoHvacStatusReader {
         config: &'a MitsubishiConfig,
     ) -> BoxFutureResult<'a, HvacDeviceStatus> {
         Box::pin(async move {
-            let client = KumoClient::new(config)?;
+            let client = KumoClient::new(self.http.clone(), config)?;
             client.get_full_status().await
         })
     }
 }
 
-#[derive(Debug, Clone, Default)]
-pub struct KumoHvacModeWriter;
+#[derive(Debug, Clone)]
+pub struct KumoHvacModeWriter {
+    reader: KumoHvacStatusReader,
+}
+
+impl KumoHvacModeWriter {
+    pub fn new() -> Result<Self> {
+        Ok(Self {
+            reader: KumoHvacStatusReader::new()?,
+        })
+    }
+
+    pub fn status_reader(&self) -> KumoHvacStatusReader {
+        self.reader.clone()
+    }
+}
 
 impl HvacModeWriter for KumoHvacModeWriter {
     fn smoke_status<'a>(
         &'a self,
         config: &'a MitsubishiConfig,
     ) -> BoxFutureResult<'a, HvacDeviceStatus> {
-        KumoHvacStatusReader.read_status(config)
+        self.reader.read_status(config)
     }
 
     fn set_mode<'a>(
@@ -160,7 +184,7 @@ impl HvacModeWriter for KumoHvacModeWriter {
         command: HvacModeCommand,
     ) -> BoxFutureResult<'a, HvacDeviceStatus> {
         Box::pin(async move {
-            let client = KumoClient::new(config)?;
+            let client = KumoClient::new(self.reader.http.clone(), config)?;
             client.send_mode_command(command).await?;
             client.get_full_status().await
         })
@@ -524,6 +548,7 @@ impl HvacState {
 #[derive(Debug, Clone)]
 struct KumoClient {
     http: Client,
+    timeout: Duration,
     base_url: String,
     username: String,
     password: String,
@@ -531,18 +556,14 @@ struct KumoClient {
 }
 
 impl KumoClient {
-    fn new(config: &MitsubishiConfig) -> Result<Self> {
+    fn new(http: Client, config: &MitsubishiConfig) -> Result<Self> {
         if !config.is_configured() {
             bail!("Mitsubishi Kumo config is incomplete");
         }
 
-        let http = Client::builder()
-            .timeout(Duration::from_secs(config.status_timeout_seconds.max(1)))
-            .build()
-            .context("failed to build Kumo HTTP client")?;
-
         Ok(Self {
             http,
+            timeout: Duration::from_secs(config.status_timeout_seconds.max(1)),
             base_url: config.base_url.trim_end_matches('/').to_string(),
             username: config
                 .username
@@ -599,7 +620,7 @@ impl KumoClient {
         let response = self
             .http
             .post(self.url("/v3/login"))
-            .headers(kumo_headers())
+            .timeout(self.timeout)
             .json(&json!({
                 "username": self.username,
                 "password": self.password,
@@ -631,7 +652,7 @@ impl KumoClient {
         let response = self
             .http
             .get(self.url(path))
-            .headers(kumo_headers())
+            .timeout(self.timeout)
             .bearer_auth(token)
             .send()
             .await
@@ -685,7 +706,7 @@ impl KumoClient {
         let response = self
             .http
             .post(self.url("/v3/devices/send-command"))
-            .headers(kumo_headers())
+            .timeout(self.timeout)
             .bearer_auth(token)
             .json(&json!({
                 "deviceSerial": self.device_serial,
@@ -712,6 +733,13 @@ impl KumoClient {
     }
 }
 
+fn kumo_http_client() -> Result<Client> {
+    Client::builder()
+        .default_headers(kumo_headers())
+        .build()
+        .context("failed to build Kumo HTTP client")
+}
+
 fn kumo_headers() -> header::HeaderMap {
     let mut headers = header::HeaderMap::new();
     headers.insert(
@@ -797,7 +825,11 @@ fn unix_timestamp_now() -> f64 {
     Local::now().timestamp_millis() as f64 / 1_000.0
 }
 
-pub fn start_hvac_status_poll(config: &AppConfig, hvac: HvacState) -> Option<JoinHandle<()>> {
+pub fn start_hvac_status_poll(
+    config: &AppConfig,
+    hvac: HvacState,
+    reader: KumoHvacStatusReader,
+) -> Option<JoinHandle<()>> {
     if !config.mitsubishi.is_configured() {
         tracing::info!("Mitsubishi Kumo config is incomplete; read-only HVAC polling disabled");
         return None;
@@ -805,7 +837,6 @@ pub fn start_hvac_status_poll(config: &AppConfig, hvac: HvacState) -> Option<Joi
 
     let config = config.mitsubishi.clone();
     Some(tokio::spawn(async move {
-        let reader = KumoHvacStatusReader;
         let mut interval =
             time::interval(Duration::from_secs(config.poll_interval_seconds.max(60)));
         let mut initial_status_loaded = false;
@@ -824,7 +855,7 @@ pub fn start_hvac_status_poll(config: &AppConfig, hvac: HvacState) -> Option<Joi
 }
 
 pub async fn smoke_hvac(config: &AppConfig) -> Result<HvacDeviceStatus> {
-    let reader = KumoHvacStatusReader;
+    let reader = KumoHvacStatusReader::new()?;
     reader.read_status(&config.mitsubishi).await
 }
 
@@ -836,6 +867,7 @@ fn should_skip_hvac_poll(initial_status_loaded: bool, hour: u32) -> bool {
 mod tests {
     use super::*;
     use crate::{config::ThresholdsConfig, status::Status};
+    use tokio::io::{AsyncReadExt, AsyncWriteExt};
 
     struct FakeHvacReader {
         status: HvacDeviceStatus,
@@ -1006,4 +1038,89 @@ mod tests {
         assert!(!should_skip_hvac_poll(true, 6));
         assert!(!should_skip_hvac_poll(true, 22));
     }
+
+    #[tokio::test]
+    async fn kumo_reader_client_sends_default_headers_and_request_timeout() {
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0")
+            .await
+            .expect("bind kumo server");
+        let address = listener.local_addr().expect("kumo server address");
+        let (request_tx, request_rx) = tokio::sync::oneshot::channel();
+        let server = tokio::spawn(async move {
+            let (mut stream, _) = listener.accept().await.expect("accept login request");
+            let request = read_kumo_request(&mut stream).await;
+            stream
+                .write_all(
+                    b"HTTP/1.1 503 Service Unavailable\r\ncontent-length: 0\r\nconnection: close\r\n\r\n",
+                )
+                .await
+                .expect("write login response");
+            request_tx.send(request).expect("send captured request");
+
+            let (mut stalled, _) = listener.accept().await.expect("accept stalled request");
+            read_kumo_request(&mut stalled).await;
+            time::sleep(Duration::from_secs(10)).await;
+        });
+        let config = MitsubishiConfig {
+            username: Some("user@example.test".to_string()),
+            password: Some("password".to_string()),
+            device_serial: Some("serial".to_string()),
+            base_url: format!("http://{address}"),
+            status_timeout_seconds: 1,
+            ..MitsubishiConfig::default()
+        };
+        let reader = KumoHvacStatusReader::new().expect("kumo reader");
+
+        let error = reader
+            .read_status(&config)
+            .await
+            .expect_err("login rejected");
+        assert!(format!("{error:#}").contains("Kumo login failed: 503"));
+        let request = request_rx
+            .await
+            .expect("captured request")
+            .to_ascii_lowercase();
+        assert!(request.starts_with("post /v3/login "));
+        assert!(request.contains("accept: application/json\r\n"));
+        assert!(request.contains("user-agent: kumocloud/1297 "));
+        assert!(request.contains("x-app-version: 1297\r\n"));
+        assert!(request.contains("x-app-platform: ios\r\n"));
+
+        let error = time::timeout(Duration::from_secs(5), reader.read_status(&config))
+            .await
+            .expect("per-request timeout applies")
+            .expect_err("stalled login times out");
+        assert!(format!("{error:#}").contains("failed to send Kumo login request"));
+        server.abort();
+    }
+
+    async fn read_kumo_request(stream: &mut tokio::net::TcpStream) -> String {
+        let mut buffer = vec![0_u8; 8192];
+        let mut read = 0_usize;
+        loop {
+            let n = stream
+                .read(&mut buffer[read..])
+                .await
+                .expect("read kumo request");
+            read += n;
+            let request = String::from_utf8_lossy(&buffer[..read]).to_string();
+            let Some(header_end) = request.find("\r\n\r\n") else {
+                if n == 0 || read == buffer.len() {
+                    return request;
+                }
+                continue;
+            };
+            let content_length = request
+                .lines()
+                .find_map(|line| {
+                    line.to_ascii_lowercase()
+                        .strip_prefix("content-length:")
+                        .and_then(|value| value.trim().parse::<usize>().ok())
+                })
+                .unwrap_or_default();
+            if n == 0 || read >= header_end + 4 + content_length || read == buffer.len() {
+                return request;
+            }
+        }
+    }
 }
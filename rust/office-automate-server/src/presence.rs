@@ -1,7 +1,12 @@
-use std::{process::Stdio, time::Duration};
+use std::{
+    process::Stdio,
+    sync::{Arc, Mutex},
+    time::Duration,
+};
 
 use anyhow::{Context, Result, bail};
 use chrono::Local;
+use serde::Deserialize;
 use tokio::{process::Command, time::timeout};
 
 use crate::config::{AppConfig, PresenceConfig};
@@ -18,30 +23,172 @@ pub struct PresenceSnapshot {
 #[derive(Debug, Clone)]
 pub struct MacOsPresenceReader {
     command_timeout: Duration,
+    display_cache: Arc<Mutex<Option<DisplayCache>>>,
+}
+
+#[derive(Debug, Deserialize)]
+struct DisplaysReport {
+    #[serde(rename = "SPDisplaysDataType")]
+    gpus: Vec<GpuDisplays>,
+}
+
+#[derive(Debug, Deserialize)]
+struct GpuDisplays {
+    #[serde(default, rename = "spdisplays_ndrvs")]
+    displays: Vec<DisplayEntry>,
+}
+
+#[derive(Debug, Deserialize)]
+struct DisplayEntry {
+    #[serde(rename = "_name")]
+    name: Option<String>,
+    #[serde(rename = "spdisplays_connection_type")]
+    connection_type: Option<String>,
+    #[serde(rename = "spdisplays_display_type")]
+    display_type: Option<String>,
+}
+
+impl DisplayEntry {
+    fn is_internal(&self) -> bool {
+        self.connection_type.as_deref() == Some("spdisplays_internal")
+            || self
+                .display_type
+                .as_deref()
+                .is_some_and(|display_type| display_type.contains("built-in"))
+    }
+}
+
+#[derive(Debug)]
+struct DisplayCache {
+    topology: Vec<u32>,
+    display_count: usize,
+    external_displays: Vec<String>,
 }
 
 impl MacOsPresenceReader {
     pub fn from_config(config: &PresenceConfig) -> Self {
         Self {
             command_timeout: Duration::from_secs(config.command_timeout_seconds.max(1)),
+            display_cache: Arc::new(Mutex::new(None)),
         }
     }
 
     pub async fn read_snapshot(&self) -> Result<PresenceSnapshot> {
-        let idle_output =
-            run_command("ioreg", &["-c", "IOHIDSystem"], self.command_timeout).await?;
-        let idle_sample_timestamp = unix_timestamp_now();
-        let idle_seconds = parse_hid_idle_seconds(&idle_output)
-            .context("ioreg output did not include HIDIdleTime")?;
+        let idle_probe = async {
+            let idle_seconds = self.read_idle_seconds().await?;
+            Ok::<_, anyhow::Error>((idle_seconds, unix_timestamp_now()))
+        };
+        let ((idle_seconds, idle_sample_timestamp), displays) =
+            tokio::try_join!(idle_probe, self.read_display_info())?;
+
+        Ok(build_presence_snapshot(
+            idle_seconds,
+            idle_sample_timestamp,
+            displays,
+        ))
+    }
+
+    async fn read_display_info(&self) -> Result<(usize, Vec<String>)> {
+        let topology = active_display_topology();
+        if let Some(displays) = topology
+            .as_ref()
+            .and_then(|topology| self.cached_display_info(topology))
+        {
+            return Ok(displays);
+        }
 
         let display_output = run_command(
             "system_profiler",
-            &["SPDisplaysDataType"],
+            &["-json", "SPDisplaysDataType"],
             self.command_timeout,
         )
         .await?;
+        let (display_count, external_displays) = parse_display_info(&display_output)?;
+        if let Some(topology) = topology {
+            *self
+                .display_cache
+                .lock()
+                .expect("display cache lock poisoned") = Some(DisplayCache {
+                topology,
+                display_count,
+                external_displays: external_displays.clone(),
+            });
+        }
+        Ok((display_count, external_displays))
+    }
+
+    fn cached_display_info(&self, topology: &[u32]) -> Option<(usize, Vec<String>)> {
+        self.display_cache
+            .lock()
+            .expect("display cache lock poisoned")
+            .as_ref()
+            .filter(|cached| cached.topology == topology)
+            .map(|cached| (cached.display_count, cached.external_displays.clone()))
+    }
+
+    async fn read_idle_seconds(&self) -> Result<f64> {
+        #[cfg(target_os = "macos")]
+        {
+            Ok(quartz::seconds_since_last_input())
+        }
+        #[cfg(not(target_os = "macos"))]
+        {
+            let idle_output =
+                run_command("ioreg", &["-c", "IOHIDSystem"], self.command_timeout).await?;
+            parse_hid_idle_seconds(&idle_output).context("ioreg output did not include HIDIdleTime")
+        }
+    }
+}
+
+// Active display IDs change whenever a monitor is attached, removed, or slept, so they key the
+// cached system_profiler result without re-running it every poll.
+fn active_display_topology() -> Option<Vec<u32>> {
+    #[cfg(target_os = "macos")]
+    {
+        quartz::active_display_ids()
+    }
+    #[cfg(not(target_os = "macos"))]
+    {
+        None
+    }
+}
 
-        build_presence_snapshot(idle_seconds, idle_sample_timestamp, &display_output)
+#[cfg(target_os = "macos")]
+mod quartz {
+    // kCGEventSourceStateHIDSystemState and kCGAnyInputEventType.
+    const HID_SYSTEM_STATE: i32 = 1;
+    const ANY_INPUT_EVENT_TYPE: u32 = u32::MAX;
+
+    const MAX_ACTIVE_DISPLAYS: usize = 16;
+
+    #[link(name = "CoreGraphics", kind = "framework")]
+    unsafe extern "C" {
+        fn CGEventSourceSecondsSinceLastEventType(state_id: i32, event_type: u32) -> f64;
+        fn CGGetActiveDisplayList(
+            max_displays: u32,
+            active_displays: *mut u32,
+            display_count: *mut u32,
+        ) -> i32;
+    }
+
+    pub fn seconds_since_last_input() -> f64 {
+        // SAFETY: a pure query on the HID event source that takes plain integers.
+        unsafe { CGEventSourceSecondsSinceLastEventType(HID_SYSTEM_STATE, ANY_INPUT_EVENT_TYPE) }
+    }
+
+    pub fn active_display_ids() -> Option<Vec<u32>> {
+        let mut display_ids = [0_u32; MAX_ACTIVE_DISPLAYS];
+        let mut display_count = 0_u32;
+        // SAFETY: the buffer holds MAX_ACTIVE_DISPLAYS entries and CoreGraphics writes at most
+        // that many IDs, reporting how many it filled through display_count.
+        let error = unsafe {
+            CGGetActiveDisplayList(
+                MAX_ACTIVE_DISPLAYS as u32,
+                display_ids.as_mut_ptr(),
+                &mut display_count,
+            )
+        };
+        (error == 0).then(|| display_ids[..display_count as usize].to_vec())
     }
 }
 
@@ -70,7 +217,8 @@ async fn run_command(program: &str, args: &[&str], command_timeout: Duration) ->
         bail!("{program} failed with status {}: {stderr}", output.status);
     }
 
-    Ok(String::from_utf8_lossy(&output.stdout).to_string())
+    Ok(String::from_utf8(output.stdout)
+        .unwrap_or_else(|error| String::from_utf8_lossy(error.as_bytes()).into_owned()))
 }
 
 pub fn parse_hid_idle_seconds(output: &str) -> Option<f64> {
@@ -86,86 +234,38 @@ pub fn parse_hid_idle_seconds(output: &str) -> Option<f64> {
         .map(|nanoseconds| nanoseconds / 1_000_000_000.0)
 }
 
-pub fn parse_display_info(output: &str) -> (usize, Vec<String>) {
-    let lines = output.lines().collect::<Vec<_>>();
-    let mut all_displays = Vec::new();
+pub fn parse_display_info(output: &str) -> Result<(usize, Vec<String>)> {
+    let report: DisplaysReport = serde_json::from_str(output)
+        .context("system_profiler output is not an SPDisplaysDataType report")?;
+    let mut display_count = 0;
     let mut external_displays = Vec::new();
 
-    for (index, line) in lines.iter().enumerate() {
-        let stripped = line.trim();
-        if !is_display_heading_candidate(stripped) {
-            continue;
-        }
-
-        let display_name = stripped.trim_end_matches(':').to_string();
-        let mut is_display = false;
-        let mut is_internal = false;
-
-        for lookahead in lines.iter().skip(index + 1).take(15) {
-            let lookahead = lookahead.trim();
-            if is_display_heading_candidate(lookahead) {
-                break;
-            }
-            if lookahead.contains("Resolution") || lookahead.contains("Display Type") {
-                is_display = true;
-            }
-            if lookahead.contains("Built-in") || lookahead.contains("Connection Type: Internal") {
-                is_internal = true;
-            }
-        }
-
-        if is_display {
-            all_displays.push(display_name.clone());
-            if !is_internal {
-                external_displays.push(display_name);
-            }
+    for display in report.gpus.into_iter().flat_map(|gpu| gpu.displays) {
+        display_count += 1;
+        if !display.is_internal() {
+            external_displays.push(
+                display
+                    .name
+                    .unwrap_or_else(|| "Unknown Display".to_string()),
+            );
         }
     }
 
-    (all_displays.len(), external_displays)
+    Ok((display_count, external_displays))
 }
 
 fn build_presence_snapshot(
     idle_seconds: f64,
     idle_sample_timestamp: f64,
-    display_output: &str,
-) -> Result<PresenceSnapshot> {
-    let (display_count, external_displays) = parse_display_info(display_output);
-
-    Ok(PresenceSnapshot {
+    (display_count, external_displays): (usize, Vec<String>),
+) -> PresenceSnapshot {
+    PresenceSnapshot {
         last_active_timestamp: idle_sample_timestamp - idle_seconds,
         external_monitor: !external_displays.is_empty(),
         idle_seconds,
         display_count,
         external_displays,
-    })
-}
-
-fn is_display_heading_candidate(stripped: &str) -> bool {
-    const SKIP_PREFIXES: &[&str] = &[
-        "Chipset",
-        "Type:",
-        "Bus:",
-        "Vendor:",
-        "Metal",
-        "Total",
-        "Graphics/Displays:",
-        "Apple M",
-        "Resolution",
-        "Display Type",
-        "Main Display",
-        "Mirror",
-        "Online",
-        "Rotation",
-        "Connection",
-        "Automatically",
-        "UI Looks",
-    ];
-
-    stripped.ends_with(':')
-        && !SKIP_PREFIXES
-            .iter()
-            .any(|prefix| stripped.starts_with(prefix))
+    }
 }
 
 fn unix_timestamp_now() -> f64 {
@@ -188,30 +288,32 @@ mod tests {
 
     #[test]
     fn parses_internal_and_external_displays() {
-        let output = r#"
-Graphics/Displays:
-
-    Apple M2:
-
-      Chipset Model: Apple M2
-
-      Color LCD:
-        Resolution: 3456 x 2234 Retina
-        Main Display: Yes
-        Connection Type: Internal
-
-      DELL U2720Q:
-        Resolution: 3840 x 2160
-        Display Type: External
-        Main Display: No
-
-      LG HDR 4K:
-        Resolution: 3840 x 2160
-        Display Type: External
-        Main Display: No
-"#;
+        let output = r#"{
+  "SPDisplaysDataType": [
+    {
+      "_name": "Apple M2",
+      "sppci_model": "Apple M2",
+      "spdisplays_ndrvs": [
+        {
+          "_name": "Color LCD",
+          "_spdisplays_resolution": "3456 x 2234 Retina",
+          "spdisplays_connection_type": "spdisplays_internal",
+          "spdisplays_main": "spdisplays_yes"
+        },
+        {
+          "_name": "DELL U2720Q",
+          "_spdisplays_resolution": "3840 x 2160"
+        },
+        {
+          "_name": "LG HDR 4K",
+          "_spdisplays_resolution": "3840 x 2160"
+        }
+      ]
+    }
+  ]
+}"#;
 
-        let (display_count, external_displays) = parse_display_info(output);
+        let (display_count, external_displays) = parse_display_info(output).expect("display info");
 
         assert_eq!(display_count, 3);
         assert_eq!(external_displays, vec!["DELL U2720Q", "LG HDR 4K"]);
@@ -219,32 +321,66 @@ Graphics/Displays:
 
     #[test]
     fn treats_builtin_only_display_as_no_external_monitor() {
-        let output = r#"
-Graphics/Displays:
-    Apple M2:
-      Color LCD:
-        Resolution: 3456 x 2234 Retina
-        Display Type: Built-in Retina LCD
-"#;
+        let output = r#"{
+  "SPDisplaysDataType": [
+    {
+      "_name": "Apple M2",
+      "spdisplays_ndrvs": [
+        {
+          "_name": "Color LCD",
+          "spdisplays_display_type": "spdisplays_built-in_retina"
+        }
+      ]
+    }
+  ]
+}"#;
 
-        let (display_count, external_displays) = parse_display_info(output);
+        let (display_count, external_displays) = parse_display_info(output).expect("display info");
 
         assert_eq!(display_count, 1);
         assert!(external_displays.is_empty());
     }
 
+    #[test]
+    fn gpu_without_attached_displays_reports_none() {
+        let output = r#"{"SPDisplaysDataType": [{"_name": "Apple M2"}]}"#;
+
+        assert_eq!(
+            parse_display_info(output).expect("display info"),
+            (0, Vec::new())
+        );
+        assert!(parse_display_info("Graphics/Displays:").is_err());
+    }
+
+    #[test]
+    fn cached_display_info_requires_matching_topology() {
+        let reader = MacOsPresenceReader::from_config(&PresenceConfig::default());
+        *reader.display_cache.lock().expect("display cache lock") = Some(DisplayCache {
+            topology: vec![1, 2],
+            display_count: 2,
+            external_displays: vec!["DELL U2720Q".to_string()],
+        });
+
+        assert_eq!(
+            reader.cached_display_info(&[1, 2]),
+            Some((2, vec!["DELL U2720Q".to_string()]))
+        );
+        assert_eq!(reader.cached_display_info(&[1]), None);
+    }
+
     #[test]
     fn last_active_timestamp_uses_idle_sample_time() {
-        let display_output = r#"
-Graphics/Displays:
-    Apple M2:
-      DELL U2720Q:
-        Resolution: 3840 x 2160
-        Display Type: External
-"#;
-
-        let snapshot =
-            build_presence_snapshot(1.0, 1000.0, display_output).expect("presence snapshot");
+        let display_output = r#"{
+  "SPDisplaysDataType": [
+    {"_name": "Apple M2", "spdisplays_ndrvs": [{"_name": "DELL U2720Q"}]}
+  ]
+}"#;
+
+        let snapshot = build_presence_snapshot(
+            1.0,
+            1000.0,
+            parse_display_info(display_output).expect("display info"),
+        );
 
         assert_eq!(snapshot.last_active_timestamp, 999.0);
         assert!(snapshot.external_monitor);
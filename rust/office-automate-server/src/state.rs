@@ -22,8 +22,8 @@ impl OccupancyState {
 pub struct StateConfig {
     pub motion_timeout_seconds: f64,
     pub departure_verification_seconds: f64,
-    pub door_open_threshold_minutes: f64,
-    pub door_open_away_timeout_minutes: f64,
+    pub door_open_threshold_seconds: f64,
+    pub door_open_away_timeout_seconds: f64,
     pub co2_critical_ppm: i64,
     pub co2_refresh_target_ppm: i64,
     pub contact_sensors_enabled: bool,
@@ -41,8 +41,8 @@ impl StateConfig {
         Self {
             motion_timeout_seconds: thresholds.motion_timeout_seconds as f64,
             departure_verification_seconds: thresholds.departure_verification_seconds as f64,
-            door_open_threshold_minutes: thresholds.door_open_threshold_minutes as f64,
-            door_open_away_timeout_minutes: thresholds.door_open_away_timeout_minutes as f64,
+            door_open_threshold_seconds: thresholds.door_open_threshold_minutes as f64 * 60.0,
+            door_open_away_timeout_seconds: thresholds.door_open_away_timeout_minutes as f64 * 60.0,
             co2_critical_ppm: thresholds.co2_critical_ppm,
             co2_refresh_target_ppm: thresholds.co2_refresh_target_ppm,
             contact_sensors_enabled: room_mode.contact_sensors_enabled,
@@ -55,8 +55,8 @@ impl Default for StateConfig {
         Self {
             motion_timeout_seconds: 60.0,
             departure_verification_seconds: 120.0,
-            door_open_threshold_minutes: 5.0,
-            door_open_away_timeout_minutes: 5.0,
+            door_open_threshold_seconds: 300.0,
+            door_open_away_timeout_seconds: 300.0,
             co2_critical_ppm: 2000,
             co2_refresh_target_ppm: 500,
             contact_sensors_enabled: true,
@@ -107,7 +107,7 @@ pub struct StateTransition {
 
 #[derive(Debug, Clone, PartialEq, Serialize)]
 pub struct StateStatus {
-    pub state: String,
+    pub state: &'static str,
     pub is_present: bool,
     pub presence_signal_active: bool,
     pub safety_interlock: bool,
@@ -181,8 +181,7 @@ impl StateMachine {
             return false;
         }
         self.sensors.door_open
-            && (now - self.sensors.door_last_changed) / 60.0
-                >= self.config.door_open_threshold_minutes
+            && now - self.sensors.door_last_changed >= self.config.door_open_threshold_seconds
     }
 
     pub fn presence_signal_active_at(&self, now: f64) -> bool {
@@ -202,16 +201,18 @@ impl StateMachine {
             return mac_recent || motion_recent;
         }
 
-        let mac_presence = self.sensors.external_monitor
-            && self.sensors.mac_last_active > self.sensors.door_last_changed;
-        let motion_age = now - self.sensors.motion_last_seen;
-        let motion_recent =
-            self.sensors.motion_detected || motion_age < self.config.motion_timeout_seconds;
-        let motion_inside = motion_recent
-            && !self.sensors.door_open
-            && self.sensors.motion_last_seen > self.sensors.door_last_changed;
+        if self.sensors.external_monitor
+            && self.sensors.mac_last_active > self.sensors.door_last_changed
+        {
+            return true;
+        }
+        if self.sensors.door_open || self.sensors.motion_last_seen <= self.sensors.door_last_changed
+        {
+            return false;
+        }
 
-        mac_presence || motion_inside
+        self.sensors.motion_detected
+            || now - self.sensors.motion_last_seen < self.config.motion_timeout_seconds
     }
 
     fn signal_recent_at(&self, timestamp: f64, now: f64) -> bool {
@@ -478,7 +479,7 @@ impl StateMachine {
 
     pub fn status_at(&self, now: f64) -> StateStatus {
         StateStatus {
-            state: self.state.as_str().to_string(),
+            state: self.state.as_str(),
             is_present: self.state == OccupancyState::Present,
             presence_signal_active: self.presence_signal_active_at(now),
             safety_interlock: self.safety_interlock_active(),
@@ -524,8 +525,7 @@ impl StateMachine {
 
     fn start_door_open_away_timer(&mut self, now: f64) {
         if self.config.contact_sensors_enabled && self.state == OccupancyState::Present {
-            self.door_open_away_deadline =
-                Some(now + self.config.door_open_away_timeout_minutes * 60.0);
+            self.door_open_away_deadline = Some(now + self.config.door_open_away_timeout_seconds);
         }
     }
 
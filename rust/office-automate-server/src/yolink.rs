@@ -4,10 +4,11 @@ use std::{
     path::PathBuf,
     pin::Pin,
     sync::{Arc, Mutex, RwLock},
-    time::Duration,
+    time::{Duration, Instant},
 };
 
 use anyhow::{Context, Result, anyhow, bail};
+use rand::Rng;
 use rumqttc::{AsyncClient, Event, Incoming, MqttOptions, QoS};
 use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
@@ -27,6 +28,8 @@ const MAX_YOLINK_NAME_BYTES: usize = 128;
 const MAX_YOLINK_TOKEN_BYTES: usize = 512;
 const MAX_YOLINK_DETAIL_STRING_BYTES: usize = 128;
 const MAX_YOLINK_DETAIL_FIELDS: usize = 16;
+const YOLINK_RECONNECT_MAX_DELAY_SECONDS: u64 = 300;
+const YOLINK_HEALTHY_SESSION_SECONDS: u64 = 60;
 
 pub type DeviceIngressHook = Arc<dyn Fn(Option<StateTransition>) + Send + Sync + 'static>;
 
@@ -128,6 +131,7 @@ struct YoLinkInner {
     door_device_id: Option<String>,
     window_device_id: Option<String>,
     motion_device_id: Option<String>,
+    device_roles: HashMap<String, DeviceRole>,
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -192,6 +196,16 @@ impl YoLinkState {
             }
             inner.devices.insert(device.device_id.clone(), device);
         }
+
+        let roles = [
+            (inner.motion_device_id.clone(), DeviceRole::Motion),
+            (inner.window_device_id.clone(), DeviceRole::Window),
+            (inner.door_device_id.clone(), DeviceRole::Door),
+        ];
+        inner.device_roles = roles
+            .into_iter()
+            .filter_map(|(device_id, role)| Some((device_id?, role)))
+            .collect();
     }
 
     pub fn device(&self, device_id: &str) -> Option<YoLinkDevice> {
@@ -350,13 +364,7 @@ impl YoLinkState {
         event_data: &Value,
     ) -> Result<Option<ValidatedYoLinkEvent>> {
         let inner = self.inner.read().expect("yolink state lock poisoned");
-        let role = if inner.door_device_id.as_deref() == Some(device_id) {
-            DeviceRole::Door
-        } else if inner.window_device_id.as_deref() == Some(device_id) {
-            DeviceRole::Window
-        } else if inner.motion_device_id.as_deref() == Some(device_id) {
-            DeviceRole::Motion
-        } else {
+        let Some(&role) = inner.device_roles.get(device_id) else {
             return Ok(None);
         };
         let Some(device) = inner.devices.get(device_id) else {
@@ -420,7 +428,7 @@ impl YoLinkState {
             .read()
             .expect("state machine lock poisoned")
             .status_at(now);
-        status.state = machine_status.state;
+        status.state = machine_status.state.to_string();
         status.is_present = machine_status.is_present;
         status.presence_signal_active = machine_status.presence_signal_active;
         status.safety_interlock = machine_status.safety_interlock;
@@ -448,6 +456,8 @@ impl YoLinkState {
 pub struct YoLinkCloudClient {
     config: YoLinkConfig,
     http: reqwest::Client,
+    token_url: String,
+    api_url: String,
 }
 
 type BoxFutureResult<'a, T> = Pin<Box<dyn Future<Output = Result<T>> + Send + 'a>>;
@@ -461,6 +471,8 @@ pub trait YoLinkApi: Send + Sync {
 impl YoLinkCloudClient {
     pub fn new(config: YoLinkConfig) -> Self {
         Self {
+            token_url: format!("{}/open/yolink/token", config.http_url),
+            api_url: format!("{}/open/yolink/v2/api", config.http_url),
             config,
             http: reqwest::Client::new(),
         }
@@ -469,7 +481,7 @@ impl YoLinkCloudClient {
     pub async fn authenticate(&self) -> Result<String> {
         let response: Value = self
             .http
-            .post(format!("{}/open/yolink/token", self.config.http_url))
+            .post(&self.token_url)
             .form(&[
                 ("grant_type", "client_credentials"),
                 ("client_id", self.config.uaid.as_str()),
@@ -494,7 +506,7 @@ impl YoLinkCloudClient {
     async fn api_call(&self, access_token: &str, method: &str) -> Result<Value> {
         let response: Value = self
             .http
-            .post(format!("{}/open/yolink/v2/api", self.config.http_url))
+            .post(&self.api_url)
             .bearer_auth(access_token)
             .json(&json!({
                 "method": method,
@@ -722,8 +734,21 @@ fn sanitize_yolink_detail_value(value: &Value) -> Option<Value> {
     }
 }
 
-pub fn reconnect_delay(config: &YoLinkConfig) -> Duration {
-    Duration::from_secs(config.reconnect_delay_seconds.max(1))
+pub fn reconnect_delay(config: &YoLinkConfig, consecutive_failures: u32) -> Duration {
+    let base = config.reconnect_delay_seconds.max(1);
+    let ceiling = base
+        .saturating_mul(1_u64 << consecutive_failures.min(16))
+        .min(YOLINK_RECONNECT_MAX_DELAY_SECONDS.max(base));
+    Duration::from_secs(ceiling)
+}
+
+fn jittered_reconnect_delay(config: &YoLinkConfig, consecutive_failures: u32) -> Duration {
+    let base = reconnect_delay(config, 0);
+    let ceiling = reconnect_delay(config, consecutive_failures);
+    if ceiling <= base {
+        return base;
+    }
+    rand::thread_rng().gen_range(base..=ceiling)
 }
 
 pub fn start_yolink_client(
@@ -739,7 +764,9 @@ pub fn start_yolink_client(
 
     let config = config.clone();
     Some(tokio::spawn(async move {
+        let mut consecutive_failures = 0_u32;
         loop {
+            let session_started = Instant::now();
             if let Err(error) = run_yolink_client_once(
                 &config,
                 yolink.clone(),
@@ -750,7 +777,15 @@ pub fn start_yolink_client(
             {
                 tracing::warn!("YoLink client stopped: {error:#}");
             }
-            tokio::time::sleep(reconnect_delay(&config.yolink)).await;
+            if session_started.elapsed() >= Duration::from_secs(YOLINK_HEALTHY_SESSION_SECONDS) {
+                consecutive_failures = 0;
+            }
+            tokio::time::sleep(jittered_reconnect_delay(
+                &config.yolink,
+                consecutive_failures,
+            ))
+            .await;
+            consecutive_failures = consecutive_failures.saturating_add(1);
         }
     }))
 }
@@ -1934,18 +1969,44 @@ mod tests {
     #[test]
     fn reconnect_delay_uses_configured_minimum() {
         assert_eq!(
-            reconnect_delay(&YoLinkConfig {
-                reconnect_delay_seconds: 10,
-                ..YoLinkConfig::default()
-            }),
+            reconnect_delay(
+                &YoLinkConfig {
+                    reconnect_delay_seconds: 10,
+                    ..YoLinkConfig::default()
+                },
+                0
+            ),
             Duration::from_secs(10)
         );
         assert_eq!(
-            reconnect_delay(&YoLinkConfig {
-                reconnect_delay_seconds: 0,
-                ..YoLinkConfig::default()
-            }),
+            reconnect_delay(
+                &YoLinkConfig {
+                    reconnect_delay_seconds: 0,
+                    ..YoLinkConfig::default()
+                },
+                0
+            ),
             Duration::from_secs(1)
         );
     }
+
+    #[test]
+    fn reconnect_delay_backs_off_exponentially_with_cap_and_jitter() {
+        let config = YoLinkConfig {
+            reconnect_delay_seconds: 5,
+            ..YoLinkConfig::default()
+        };
+
+        assert_eq!(reconnect_delay(&config, 1), Duration::from_secs(10));
+        assert_eq!(reconnect_delay(&config, 3), Duration::from_secs(40));
+        assert_eq!(
+            reconnect_delay(&config, 20),
+            Duration::from_secs(YOLINK_RECONNECT_MAX_DELAY_SECONDS)
+        );
+        for _ in 0..32 {
+            let delay = jittered_reconnect_delay(&config, 3);
+            assert!(delay >= Duration::from_secs(5));
+            assert!(delay <= Duration::from_secs(40));
+        }
+    }
 }
@@ -187,13 +187,29 @@ def save_auth_cache(auth_file: Path, auth_cache: dict[str, Any]) -> None:
         with os.fdopen(fd, "w") as fh:
             json.dump(auth_cache, fh, indent=2, sort_keys=True)
             fh.write("\n")
+            fh.flush()
+            os.fsync(fh.fileno())
         tmp_path.chmod(0o600)
         os.replace(tmp_path, auth_file)
+        fsync_directory(parent)
     finally:
         if tmp_path.exists():
             tmp_path.unlink()
 
 
+def fsync_directory(path: Path) -> None:
+    try:
+        dir_fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 def should_chmod_auth_parent(auth_file: Path, parent_preexisted: bool) -> bool:
     if not parent_preexisted:
         return True